@@ -8,6 +8,8 @@ from jwt import ExpiredSignatureError
 from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
+from .fast_json import response_json
+
 
 class ApigeeProdCredentials(BaseSettings):
     """
@@ -220,7 +222,7 @@ class ApigeeAuthenticator:
             )
             try:
                 resp.raise_for_status()
-                return resp.json()["access_token"]
+                return response_json(resp)["access_token"]
             except requests.HTTPError as e:  # TODO some more fancy error message...
                 raise e
         else:
@@ -282,6 +284,35 @@ class ApigeeClient(RestClient):
         )
         return self._session.delete(*args, **kwargs)
 
+    def mount(self, prefix: str, adapter: requests.adapters.BaseAdapter) -> None:
+        """Use `adapter` for requests whose url starts with `prefix`,
+        e.g. to add retries or timeouts. See `requests.Session.mount`."""
+        self._session.mount(prefix, adapter)
+
+
+_ERROR_CONTENT_LIMIT = 512
+
+
+def _error_content(resp: requests.Response) -> str:
+    """
+    The start of a failed response's body, for error messages. Apigee
+    error pages can be large and we don't need all of them.
+    """
+    return resp.content[:_ERROR_CONTENT_LIMIT].decode("utf-8", "replace")
+
+
+_NOT_IMPLEMENTED_MSG = (
+    "Ugh! this is awkward, {} is not available yet...feel free to give us a shout or to open a PR "
+    "https://github.com/NHSDigital/pytest-nhsd-apim"
+)
+
+
+class _NotImplementedAPI:
+    """Placeholder for Apigee APIs we haven't wrapped yet."""
+
+    def __init__(self, client: RestClient) -> None:
+        raise NotImplementedError(_NOT_IMPLEMENTED_MSG.format(type(self).__name__))
+
 
 class DeveloperAppsAPI:
     """Manage developers that register apps."""
@@ -306,9 +337,9 @@ class DeveloperAppsAPI:
         resp = self.client.get(url=url, params=params)
         if resp.status_code != 200:
             raise Exception(
-                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def create_app(self, email: str, body: dict) -> "dict":
         """
@@ -360,9 +391,9 @@ class DeveloperAppsAPI:
         resp = self.client.post(url=url, json=body)
         if resp.status_code != 201:
             raise Exception(
-                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def get_app_by_name(self, email: str, app_name: str, **query_params) -> "dict":
         """Gets the profile of a specific developer app."""
@@ -373,9 +404,9 @@ class DeveloperAppsAPI:
         resp = self.client.get(url=url, params=params)
         if resp.status_code != 200:
             raise Exception(
-                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def post_app_by_name(self, email: str, app_name: str, body: dict) -> "dict":
         """
@@ -417,9 +448,9 @@ class DeveloperAppsAPI:
         resp = self.client.post(url=url, json=body)
         if resp.status_code != 200:
             raise Exception(
-                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def put_app_by_name(self, email: str, app_name: str, body: dict) -> "dict":
         """
@@ -450,9 +481,9 @@ class DeveloperAppsAPI:
         resp = self.client.put(url=url, json=body)
         if resp.status_code != 200:
             raise Exception(
-                f"PUT request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"PUT request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def delete_app_by_name(self, email: str, app_name: str) -> None:
         """
@@ -470,9 +501,9 @@ class DeveloperAppsAPI:
         resp = self.client.delete(url=url)
         if resp.status_code != 200:
             raise Exception(
-                f"DELETE request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"DELETE request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def get_app_attributes(self, email: str, app_name) -> "dict":
         """Gets developer app attributes and their values."""
@@ -482,9 +513,9 @@ class DeveloperAppsAPI:
         resp = self.client.get(url=url)
         if resp.status_code != 200:
             raise Exception(
-                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def post_app_attributes(self, email: str, app_name: str, body: dict) -> "dict":
         """
@@ -509,9 +540,9 @@ class DeveloperAppsAPI:
         resp = self.client.post(url=url, json=body)
         if resp.status_code != 200:
             raise Exception(
-                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def get_app_attribute_by_name(
         self, email: str, app_name: str, attribute_name: str
@@ -523,9 +554,9 @@ class DeveloperAppsAPI:
         resp = self.client.get(url=url)
         if resp.status_code != 200:
             raise Exception(
-                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def post_app_attribute_by_name(
         self, email: str, app_name: str, attribute_name: str, body: dict
@@ -547,9 +578,9 @@ class DeveloperAppsAPI:
         resp = self.client.post(url=url, json=body)
         if resp.status_code != 200:
             raise Exception(
-                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def delete_app_attribute_by_name(
         self, email: str, app_name: str, attribute_name: str
@@ -561,9 +592,9 @@ class DeveloperAppsAPI:
         resp = self.client.delete(url=url)
         if resp.status_code != 200:
             raise Exception(
-                f"DELETE request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"DELETE request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
 
 class ApiProductsAPI:
@@ -605,9 +636,9 @@ class ApiProductsAPI:
         resp = self.client.get(url=url, params=query_params)
         if resp.status_code != 200:
             raise Exception(
-                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def post_products(self, body: dict) -> "dict":
         """
@@ -671,9 +702,9 @@ class ApiProductsAPI:
         resp = self.client.post(url=url, json=body)
         if resp.status_code != 201:
             raise Exception(
-                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def get_product_by_name(self, product_name: str, **query_params) -> "dict":
         """
@@ -694,9 +725,9 @@ class ApiProductsAPI:
         resp = self.client.get(url=url, params=query_params)
         if resp.status_code != 200:
             raise Exception(
-                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def put_product_by_name(self, product_name: str, body: dict) -> "dict":
         """
@@ -723,9 +754,9 @@ class ApiProductsAPI:
         resp = self.client.put(url=url, json=body)
         if resp.status_code != 200:
             raise Exception(
-                f"PUT request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"PUT request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def delete_product_by_name(self, product_name: str) -> "dict":
         """
@@ -746,9 +777,9 @@ class ApiProductsAPI:
         resp = self.client.delete(url=url)
         if resp.status_code != 200:
             raise Exception(
-                f"DELETE request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"DELETE request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def get_product_attributes(self, product_name: str) -> "dict":
         """Lists all API product attributes"""
@@ -757,9 +788,9 @@ class ApiProductsAPI:
         resp = self.client.get(url=url)
         if resp.status_code != 200:
             raise Exception(
-                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def post_product_attributest(self, product_name: str, body: dict) -> "dict":
         """
@@ -781,9 +812,9 @@ class ApiProductsAPI:
         resp = self.client.post(url=url, json=body)
         if resp.status_code != 200:
             raise Exception(
-                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def get_product_attribute_by_name(
         self, product_name: str, attribute_name: str
@@ -794,9 +825,9 @@ class ApiProductsAPI:
         resp = self.client.get(url=url)
         if resp.status_code != 200:
             raise Exception(
-                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def post_product_attribute_by_name(
         self, product_name: str, attribute_name: str, body: dict
@@ -817,9 +848,9 @@ class ApiProductsAPI:
         resp = self.client.post(url=url, json=body)
         if resp.status_code != 200:
             raise Exception(
-                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def delete_product_attribute_by_name(
         self, product_name: str, attribute_name: str
@@ -830,9 +861,9 @@ class ApiProductsAPI:
         resp = self.client.delete(url=url)
         if resp.status_code != 200:
             raise Exception(
-                f"DELETE request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"DELETE request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
 
 class DebugSessionsAPI:
@@ -859,9 +890,9 @@ class DebugSessionsAPI:
         resp = self.client.get(url=url)
         if resp.status_code != 200:
             raise Exception(
-                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def post_debugsession(self, session: str = "default", header_filters: dict = {}, qparam_filters: dict = {}):
         """
@@ -927,9 +958,9 @@ class DebugSessionsAPI:
         resp = self.client.post(url=url, params=query_params)
         if resp.status_code != 201:
             raise Exception(
-                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def delete_debugsession_by_name(self, session_name: str):
         """Deletes a debug session."""
@@ -938,9 +969,9 @@ class DebugSessionsAPI:
         resp = self.client.delete(url=url)
         if resp.status_code != 200:
             raise Exception(
-                f"DELETE request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"DELETE request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def get_transaction_data(self, session_name: str):
         """
@@ -958,9 +989,9 @@ class DebugSessionsAPI:
         resp = self.client.get(url=url)
         if resp.status_code != 200:
             raise Exception(
-                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def get_transaction_data_by_id(self, session_name: str, transaction_id: str):
         """
@@ -976,17 +1007,16 @@ class DebugSessionsAPI:
         resp = self.client.get(url=url)
         if resp.status_code != 200:
             raise Exception(
-                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def get_apigee_variable_from_trace(self, name: str, data: dict):
         executions = [
             x.get("results", None)
             for x in data["point"]
-            if x.get("id", "") == "Execution"
+            if x.get("id", "") == "Execution" and x.get("results", None) != []
         ]
-        executions = list(filter(lambda x: x != [], executions))
 
         variable_accesses = []
 
@@ -1028,9 +1058,9 @@ class AccessTokensAPI:
         resp = self.client.get(url=url)
         if resp.status_code != 200:
             raise Exception(
-                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def post_token_details(self, access_token: str, body: dict, **query_params):
         """
@@ -1049,9 +1079,9 @@ class AccessTokensAPI:
         resp = self.client.post(url=url, json=body, params=query_params)
         if resp.status_code != 200:
             raise Exception(
-                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def delete_token(self, access_token: str):
         """Deletes the specified OAuth 2.0 access token."""
@@ -1060,9 +1090,9 @@ class AccessTokensAPI:
         resp = self.client.delete(url=url)
         if resp.status_code != 200:
             raise Exception(
-                f"DELETE request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"DELETE request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def revoke_token(self, **query_params):
         """
@@ -1114,9 +1144,9 @@ class AccessTokensAPI:
         resp = self.client.post(url=url, params=query_params)
         if resp.status_code != 200:
             raise Exception(
-                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def search_token(self, **query_params):
         """
@@ -1213,25 +1243,17 @@ class AccessTokensAPI:
         resp = self.client.get(url=url, params=query_params)
         if resp.status_code != 200:
             raise Exception(
-                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
 
-class DeploymentsAPI:
-    def __init__(self, client: RestClient) -> None:
-        self.client = client
-        raise NotImplementedError(
-            f"Ugh! this is awkward, this API is not available yet...feel free to give us a shout or to open a PR https://github.com/NHSDigital/pytest-nhsd-apim/blob/0cf274850a8fe61e17f214380496ba09fd6cc973/src/pytest_nhsd_apim/apigee_apis.py#L1142"
-        )
+class DeploymentsAPI(_NotImplementedAPI):
+    pass
 
 
-class UserRolesAPI:
-    def __init__(self, client: RestClient) -> None:
-        self.client = client
-        raise NotImplementedError(
-            f"Ugh! this is awkward, this API is not available yet...feel free to give us a shout or to open a PR https://github.com/NHSDigital/pytest-nhsd-apim/blob/0cf274850a8fe61e17f214380496ba09fd6cc973/src/pytest_nhsd_apim/apigee_apis.py#L1142"
-        )
+class UserRolesAPI(_NotImplementedAPI):
+    pass
 
 
 class AppKeysAPI:
@@ -1251,6 +1273,9 @@ class AppKeysAPI:
     def __init__(self, client: RestClient) -> None:
         self.client = client
 
+    def _app_key_url(self, email: str, app_name: str, key: str) -> str:
+        return f"{self.client.base_url}/developers/{email}/apps/{app_name}/keys/{key}"
+
     def create_app_key(self, email: str, app_name: str, body: dict) -> "dict":
         """
         Creates a custom consumer key and secret for a developer app.
@@ -1278,14 +1303,13 @@ class AppKeysAPI:
         information, see Import existing consumer keys and secrets.
         """
 
-        resource = f"/developers/{email}/apps/{app_name}/keys/create"
-        url = f"{self.client.base_url}{resource}"
+        url = self._app_key_url(email, app_name, "create")
         resp = self.client.post(url=url, json=body)
         if resp.status_code != 201:
             raise Exception(
-                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
     
     def delete_app_key(self, email: str, app_name: str, app_key: str) -> None:
         """
@@ -1301,14 +1325,13 @@ class AppKeysAPI:
         - Delete the developer app, if it is no longer required.
         """
 
-        resource = f"/developers/{email}/apps/{app_name}/keys/{app_key}"
-        url = f"{self.client.base_url}{resource}"
+        url = self._app_key_url(email, app_name, app_key)
         resp = self.client.delete(url=url)
         if resp.status_code != 200:
             raise Exception(
-                f"DELETE request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"DELETE request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
     
     def get_app_key(self, email: str, app_name: str, key: str, **query_params) -> "list[str]":
         """
@@ -1317,14 +1340,13 @@ class AppKeysAPI:
         """
 
         params = query_params
-        resource = f"/developers/{email}/apps/{app_name}/keys/{key}"
-        url = f"{self.client.base_url}{resource}"
+        url = self._app_key_url(email, app_name, key)
         resp = self.client.get(url=url, params=params)
         if resp.status_code != 200:
             raise Exception(
-                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"GET request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def post_app_key(self, email: str, app_name: str, key: str, body: dict, **query_params) -> "dict":
         """
@@ -1351,17 +1373,16 @@ class AppKeysAPI:
           will not allow API calls to go through.
         """
 
-        resource = f"/developers/{email}/apps/{app_name}/keys/{key}"
-        url = f"{self.client.base_url}{resource}"
+        url = self._app_key_url(email, app_name, key)
         resp = self.client.post(url=url, json=body, params=query_params)
         if resp.status_code != 200 and resp.status_code != 204:
             raise Exception(
-                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
         if resp.status_code == 204:
             return resp
         else:
-            return resp.json()
+            return response_json(resp)
 
     def put_app_key(self, email: str, app_name: str, key: str, body: dict) -> "dict":
         """
@@ -1393,16 +1414,15 @@ class AppKeysAPI:
         one or both back.
         """
 
-        resource = f"/developers/{email}/apps/{app_name}/keys/{key}"
-        url = f"{self.client.base_url}{resource}"
+        url = self._app_key_url(email, app_name, key)
         resp = self.client.put(url=url, json=body)
         if resp.status_code != 200:
             raise Exception(
-                f"PUT request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"PUT request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
     
-    def delete_product_app_key_association(self, email: str, app_name: str, app_key: str, apiproduct_name: str) -> None:
+    def delete_product_app_key_association(self, email: str, app_name: str, app_key: str, apiproduct_name: str) -> "dict":
         """
         Removes an API product from an app's consumer key, and thereby renders the app
         unable to access the API resources defined in that API product.
@@ -1411,14 +1431,13 @@ class AppKeysAPI:
         association of the key with the API product is removed.
         """
 
-        resource = f"/developers/{email}/apps/{app_name}/keys/{app_key}/apiproducts/{apiproduct_name}"
-        url = f"{self.client.base_url}{resource}"
+        url = self._app_key_url(email, app_name, app_key) + f"/apiproducts/{apiproduct_name}"
         resp = self.client.delete(url=url)
         if resp.status_code != 200:
             raise Exception(
-                f"DELETE request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"DELETE request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
-        return resp.json()
+        return response_json(resp)
 
     def post_product_app_key_association(self, email: str, app_name: str, key: str, apiproduct_name: str, **query_params) -> "dict":
         """
@@ -1439,59 +1458,34 @@ class AppKeysAPI:
           allow API calls to go through.
         """
 
-        resource = f"/developers/{email}/apps/{app_name}/keys/{key}/apiproducts/{apiproduct_name}"
-        url = f"{self.client.base_url}{resource}"
+        url = self._app_key_url(email, app_name, key) + f"/apiproducts/{apiproduct_name}"
         resp = self.client.post(url=url, params=query_params)
         if resp.status_code != 204:
             raise Exception(
-                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {resp.text}"
+                f"POST request to {resp.url} failed with status_code: {resp.status_code}, Reason: {resp.reason} and Content: {_error_content(resp)}"
             )
         return resp   
 
 
-class UsersAPI:
-    def __init__(self, client: RestClient) -> None:
-        self.client = client
-        raise NotImplementedError(
-            f"Ugh! this is awkward, this API is not available yet...feel free to give us a shout or to open a PR https://github.com/NHSDigital/pytest-nhsd-apim/blob/0cf274850a8fe61e17f214380496ba09fd6cc973/src/pytest_nhsd_apim/apigee_apis.py#L1142"
-        )
+class UsersAPI(_NotImplementedAPI):
+    pass
 
 
-class AuthorizationCodesAPI:
-    def __init__(self, client: RestClient) -> None:
-        self.client = client
-        raise NotImplementedError(
-            f"Ugh! this is awkward, this API is not available yet...feel free to give us a shout or to open a PR https://github.com/NHSDigital/pytest-nhsd-apim/blob/0cf274850a8fe61e17f214380496ba09fd6cc973/src/pytest_nhsd_apim/apigee_apis.py#L1142"
-        )
+class AuthorizationCodesAPI(_NotImplementedAPI):
+    pass
 
 
-class RefreshTokensAPI:
-    def __init__(self, client: RestClient) -> None:
-        self.client = client
-        raise NotImplementedError(
-            f"Ugh! this is awkward, this API is not available yet...feel free to give us a shout or to open a PR https://github.com/NHSDigital/pytest-nhsd-apim/blob/0cf274850a8fe61e17f214380496ba09fd6cc973/src/pytest_nhsd_apim/apigee_apis.py#L1142"
-        )
+class RefreshTokensAPI(_NotImplementedAPI):
+    pass
 
 
-class OrganizationsAPI:
-    def __init__(self, client: RestClient) -> None:
-        self.client = client
-        raise NotImplementedError(
-            f"Ugh! this is awkward, this API is not available yet...feel free to give us a shout or to open a PR https://github.com/NHSDigital/pytest-nhsd-apim/blob/0cf274850a8fe61e17f214380496ba09fd6cc973/src/pytest_nhsd_apim/apigee_apis.py#L1142"
-        )
+class OrganizationsAPI(_NotImplementedAPI):
+    pass
 
 
-class KVMAPI:
-    def __init__(self, client: RestClient) -> None:
-        self.client = client
-        raise NotImplementedError(
-            f"Ugh! this is awkward, this API is not available yet...feel free to give us a shout or to open a PR https://github.com/NHSDigital/pytest-nhsd-apim/blob/0cf274850a8fe61e17f214380496ba09fd6cc973/src/pytest_nhsd_apim/apigee_apis.py#L1142"
-        )
+class KVMAPI(_NotImplementedAPI):
+    pass
 
 
-class KeystoreTrustoreAPI:
-    def __init__(self, client: RestClient) -> None:
-        self.client = client
-        raise NotImplementedError(
-            f"Ugh! this is awkward, this API is not available yet...feel free to give us a shout or to open a PR https://github.com/NHSDigital/pytest-nhsd-apim/blob/0cf274850a8fe61e17f214380496ba09fd6cc973/src/pytest_nhsd_apim/apigee_apis.py#L1142"
-        )
+class KeystoreTrustoreAPI(_NotImplementedAPI):
+    pass
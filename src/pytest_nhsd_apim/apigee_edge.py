@@ -5,15 +5,26 @@ This includes app setup/teardown, getting proxy info (proxy-under-test
 + identity-service of choice), getting products, registering them with
 the test app.
 """
+import collections
 import functools
+import hashlib
+import itertools
+import os
+import threading
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Callable
+from typing import Any, Callable, Dict, Optional
 from uuid import uuid4
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from . import disk_cache, xdist_share
+from .fast_json import response_json
 from .log import log, log_method
 from .apigee_apis import (
     ApigeeNonProdCredentials,
@@ -22,12 +33,56 @@ from .apigee_apis import (
     DebugSessionsAPI,
     AccessTokensAPI,
     ApiProductsAPI,
-    DeveloperAppsAPI
+    DeveloperAppsAPI,
+    _error_content,
 )
 
 APIGEE_BASE_URL = "https://api.enterprise.apigee.com/v1/"
 
 
+# (connect, read) seconds. Apigee's management API is regularly slow
+# to respond, especially for pages of expanded products.
+_APIGEE_TIMEOUT = (3.05, 30)
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter with a default timeout, since `requests` has none.
+    """
+
+    def __init__(self, *args, timeout=_APIGEE_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def _mount_retrying_adapter(session):
+    """
+    Retry transient Apigee failures (timeouts, rate limiting, server
+    errors) with a short backoff, and allow a few concurrent
+    connections for the fixtures that fetch in the background.
+
+    Only reads are retried: a PUT or DELETE that timed out may already
+    have been applied, and retrying a POST could create a second app.
+    """
+    retries = Retry(
+        total=3,
+        connect=3,
+        read=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+        # Hand back the last response so callers report Apigee's error.
+        raise_on_status=False,
+    )
+    adapter = _TimeoutHTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+    session.mount("https://", adapter)
+
+
 @pytest.fixture(scope="session")
 @log_method
 def _apigee_edge_session(nhsd_apim_config):
@@ -36,7 +91,10 @@ def _apigee_edge_session(nhsd_apim_config):
     """
     token = nhsd_apim_config["APIGEE_ACCESS_TOKEN"]
     session = requests.session()
-    session.headers = {"Authorization": f"Bearer {token}"}
+    # update rather than replace, to keep requests' default headers
+    # (in particular Accept-Encoding: gzip).
+    session.headers.update({"Authorization": f"Bearer {token}"})
+    _mount_retrying_adapter(session)
     return session
 
 
@@ -55,9 +113,103 @@ def _apigee_app_base_url_no_dev(nhsd_apim_config):
     url = APIGEE_BASE_URL + f"organizations/{org}/apps"
     return url
 
-@functools.lru_cache(maxsize=None)
-@log_method
+
+def _check_status(resp, expected_status, err_msg):
+    """
+    Raise if `resp` doesn't have the expected status code.
+
+    Unlike a bare `assert` this still runs under `python -O`.
+    """
+    if resp.status_code != expected_status:
+        raise ValueError(f"{err_msg}\tReason: {_error_content(resp)}")
+
+
+_PROXY_JSON_TTL_SECONDS = 600
+_PROXY_JSON_CACHE = {}
+_PROXY_JSON_LOCKS = {}
+
+# Opt-in on-disk cache of proxy JSON, for quick iterative local runs.
+# It's off by default since a redeployed proxy would otherwise be
+# tested against its old revision for up to _PROXY_DISK_CACHE_TTL_SECONDS.
+#  - enabled: reuse entries younger than the TTL, otherwise ask Apigee
+#    which revision is deployed and reuse that revision's data if we
+#    have it.
+#  - replay: always reuse entries, error if there isn't one.
+#  - disabled: always fetch.
+_PROXY_DISK_CACHE_TTL_SECONDS = 300
+
+
+def _proxy_disk_cache_path(session, nhsd_apim_proxy_url):
+    # Include the token so different users/orgs never share entries.
+    token = session.headers.get("Authorization", "")
+    key = hashlib.sha256((token + nhsd_apim_proxy_url).encode()).hexdigest()
+    return disk_cache.CACHE_DIR / f"proxy-{key}.json"
+
+
+def _proxy_revision_cache_path(nhsd_apim_proxy_url, revision):
+    # The url already contains the org and proxy name.
+    key = hashlib.sha256(f"{nhsd_apim_proxy_url}:{revision}".encode()).hexdigest()
+    return disk_cache.CACHE_DIR / "revisions" / f"{key}.json"
+
+
+def _disk_cached_proxy_json(session, nhsd_apim_proxy_url):
+    mode = disk_cache.cache_mode()
+    if mode == "disabled":
+        return _fetch_proxy_json(session, nhsd_apim_proxy_url, cache_revisions=False)
+
+    path = _proxy_disk_cache_path(session, nhsd_apim_proxy_url)
+    if path.is_file():
+        age = time.time() - path.stat().st_mtime
+        if mode == "replay" or age < _PROXY_DISK_CACHE_TTL_SECONDS:
+            cached = disk_cache.read_json(path)
+            if cached is not None:
+                return cached
+    if mode == "replay":
+        raise ValueError(f"NHSD_APIM_CACHE_MODE=replay but there is no cached proxy data for {nhsd_apim_proxy_url}")
+
+    proxy_json = _fetch_proxy_json(session, nhsd_apim_proxy_url, cache_revisions=True)
+    disk_cache.write_json(path, proxy_json)
+    return proxy_json
+
+
 def _get_proxy_json(session, nhsd_apim_proxy_url):
+    """
+    Cached version of `_fetch_proxy_json`, keyed by proxy url.
+
+    Entries expire after 10 minutes so that long sessions pick up
+    redeployments. Concurrent callers for the same url wait for one
+    fetch rather than making their own.
+    """
+    with _PROXY_JSON_LOCKS.setdefault(nhsd_apim_proxy_url, threading.Lock()):
+        cached = _PROXY_JSON_CACHE.get(nhsd_apim_proxy_url)
+        if cached and time.monotonic() - cached[0] < _PROXY_JSON_TTL_SECONDS:
+            return cached[1]
+        proxy_json = _disk_cached_proxy_json(session, nhsd_apim_proxy_url)
+        _PROXY_JSON_CACHE[nhsd_apim_proxy_url] = (time.monotonic(), proxy_json)
+        return proxy_json
+
+
+def _fetch_proxy_revision_json(session, nhsd_apim_proxy_url, revision, cache_revisions):
+    """
+    Get the JSON for one revision of a proxy, from the on-disk cache if
+    `cache_revisions` is set and we've seen that revision before.
+    """
+    path = _proxy_revision_cache_path(nhsd_apim_proxy_url, revision)
+    if cache_revisions:
+        cached = disk_cache.read_json(path)
+        if cached is not None:
+            return cached
+
+    proxy_resp = session.get(nhsd_apim_proxy_url + f"/revisions/{revision}")
+    _check_status(proxy_resp, 200, f"Could not GET proxy revision {nhsd_apim_proxy_url}/revisions/{revision}.")
+    proxy_json = response_json(proxy_resp)
+    if cache_revisions:
+        disk_cache.write_json(path, proxy_json)
+    return proxy_json
+
+
+@log_method
+def _fetch_proxy_json(session, nhsd_apim_proxy_url, cache_revisions=False):
     """
     Query the apigee edge API to get data about the desired proxy, in particular its current deployment.
     """
@@ -66,22 +218,18 @@ def _get_proxy_json(session, nhsd_apim_proxy_url):
         "Please check the validity of the APIGEE credentials and token as well as any headers."
     )
     deployment_resp = session.get(f"{nhsd_apim_proxy_url}/deployments")
-    assert deployment_resp.status_code == 200, deployment_err_msg.format(deployment_resp.content)
-    deployment_json = deployment_resp.json()
+    _check_status(deployment_resp, 200, deployment_err_msg)
+    deployment_json = response_json(deployment_resp)
 
     # Should be the case
-    assert len(deployment_json["environment"]) == 1
+    if len(deployment_json["environment"]) != 1:
+        raise ValueError(f"Expected {nhsd_apim_proxy_url} to be deployed to exactly one environment")
 
     deployed_revision = next(
-        filter(
-            lambda d: d["state"] == "deployed",
-            deployment_json["environment"][0]["revision"],
-        )
+        d for d in deployment_json["environment"][0]["revision"] if d["state"] == "deployed"
     )
     revision = deployed_revision["name"]
-    proxy_resp = session.get(nhsd_apim_proxy_url + f"/revisions/{revision}")
-    assert proxy_resp.status_code == 200
-    proxy_json = proxy_resp.json()
+    proxy_json = _fetch_proxy_revision_json(session, nhsd_apim_proxy_url, revision, cache_revisions)
     proxy_json["environment"] = deployment_json["environment"][0]["name"]
     return proxy_json
 
@@ -109,31 +257,178 @@ def _apigee_proxy(_apigee_edge_session, nhsd_apim_config, nhsd_apim_proxy_name):
     return _get_proxy_json(_apigee_edge_session, apigee_edge_api_proxy_url)
 
 
+_PRODUCTS_PAGE_SIZE = 1000
+
+
+def _get_products_page(session, products_url, params):
+    return response_json(session.get(products_url, params=params))["apiProduct"]
+
+
+def _iter_products(session, products_url, params):
+    """
+    Yield every product from the paginated /apiproducts endpoint.
+
+    Apigee returns the `startKey` product as the first item of the next
+    page, so the last item of a full page is held back rather than
+    yielded twice.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        page = _get_products_page(session, products_url, params)
+        while len(page) == _PRODUCTS_PAGE_SIZE:
+            # Fetch and decode the next page in the background while
+            # this one is consumed.
+            params = {**params, "startKey": page[-1]["name"]}
+            next_page = executor.submit(_get_products_page, session, products_url, params)
+            yield from itertools.islice(page, len(page) - 1)
+            page = next_page.result()
+        yield from page
+
+
+_PRODUCT_PAGE_WORKERS = 4
+
+
+def _list_product_names(session, products_url):
+    """
+    Return every product name using the lightweight unexpanded listing,
+    which is a plain JSON array of names.
+    """
+    names = []
+    params = {"expand": "false", "count": _PRODUCTS_PAGE_SIZE}
+    while True:
+        page = response_json(session.get(products_url, params=params))
+        # Pages after the first start with the previous page's last name.
+        names.extend(page[1:] if names else page)
+        if len(page) < _PRODUCTS_PAGE_SIZE:
+            return names
+        params = {**params, "startKey": page[-1]}
+
+
+def _get_products_parallel(session, products_url):
+    """
+    Fetch the expanded product pages concurrently, starting each page at
+    a name taken from the unexpanded listing.
+    """
+    names = _list_product_names(session, products_url)
+
+    def fetch(start_key):
+        params = {"expand": "true", "count": _PRODUCTS_PAGE_SIZE, "startKey": start_key}
+        return _get_products_page(session, products_url, params)
+
+    with ThreadPoolExecutor(max_workers=_PRODUCT_PAGE_WORKERS) as executor:
+        pages = executor.map(fetch, names[::_PRODUCTS_PAGE_SIZE])
+        return list(itertools.chain.from_iterable(pages))
+
+
+_PARALLEL_PRODUCT_PAGES_VALUES = {"1": True, "true": True, "0": False, "false": False, "": False}
+
+
+def _parallel_product_pages():
+    value = os.environ.get("NHSD_APIM_PARALLEL_PRODUCT_PAGES", "")
+    if value.lower() not in _PARALLEL_PRODUCT_PAGES_VALUES:
+        raise ValueError(f"NHSD_APIM_PARALLEL_PRODUCT_PAGES must be one of 1, true, 0 or false, not `{value}`")
+    return _PARALLEL_PRODUCT_PAGES_VALUES[value.lower()]
+
+
 @log_method
 def get_all_products(_apigee_edge_session, nhsd_apim_config):
-    got_all_products = False
     org = nhsd_apim_config["APIGEE_ORGANIZATION"]
     products_url = APIGEE_BASE_URL + f"organizations/{org}/apiproducts"
-    params = {"expand": "true"}
-    products = []
-    while not got_all_products:
-        resp = _apigee_edge_session.get(products_url, params=params)
-        new_products = resp.json()["apiProduct"]
-        products.extend(new_products)
-        if len(new_products) == 1000:
-            last = products.pop()
-            params.update({"startKey": last["name"]})
-        else:
-            got_all_products = True
-    return products
+    if _parallel_product_pages():
+        return _get_products_parallel(_apigee_edge_session, products_url)
+    return list(_iter_products(_apigee_edge_session, products_url, {"expand": "true"}))
+
 
+def _products_cache_key(nhsd_apim_config):
+    org = nhsd_apim_config["APIGEE_ORGANIZATION"]
+    token = nhsd_apim_config["APIGEE_ACCESS_TOKEN"]
+    token_hash = hashlib.sha256(token.encode()).hexdigest()[:8]
+    return f"nhsd_apim/products/{org}/{token_hash}"
+
+
+def _products_cache(pytestconfig):
+    """
+    The pytest cache, if reusing the product list between runs is
+    enabled, otherwise None.
+    """
+    if disk_cache.cache_mode() == "disabled" or pytestconfig.getoption("NO_APIGEE_CACHE"):
+        return None
+    return getattr(pytestconfig, "cache", None)
+
+
+def _load_cached_products(pytestconfig, nhsd_apim_config):
+    """
+    Products saved by an earlier pytest run today, or None.
+    """
+    cache = _products_cache(pytestconfig)
+    if cache is None:
+        return None
+    cached = cache.get(_products_cache_key(nhsd_apim_config), None)
+    if cached and cached["date"] == datetime.utcnow().date().isoformat():
+        return cached["products"]
+    return None
+
+
+def _store_cached_products(pytestconfig, nhsd_apim_config, products):
+    cache = _products_cache(pytestconfig)
+    if cache is None:
+        return
+    cached = {"date": datetime.utcnow().date().isoformat(), "products": products}
+    cache.set(_products_cache_key(nhsd_apim_config), cached)
 
-_APIGEE_PRODUCTS = []
+
+def _index_products_by_proxy(products):
+    index = collections.defaultdict(list)
+    for product in products:
+        for proxy_name in set(product["proxies"]):
+            index[proxy_name].append(product)
+    return index
+
+
+@pytest.fixture(scope="session")
+@log_method
+def _apigee_products(_apigee_edge_session, nhsd_apim_config, pytestconfig) -> Callable:
+    """
+    A Callable that gets you every product in the organization.
+
+    The list is fetched at most once per session unless you ask for a
+    refresh. With NHSD_APIM_CACHE_MODE set it is also reused from the
+    pytest cache if an earlier run fetched it today, in which case
+    `_apigee_products.from_cache()` is True until it's refreshed.
+
+    `_apigee_products.for_proxy(proxy_name)` gets you just the products
+    granting access to one proxy.
+    """
+    products = None
+    from_cache = False
+    by_proxy = {}
+
+    def get(force_refresh=False):
+        nonlocal products, from_cache, by_proxy
+        if products is None and not force_refresh:
+            products = _load_cached_products(pytestconfig, nhsd_apim_config)
+            from_cache = products is not None
+            if from_cache:
+                by_proxy = _index_products_by_proxy(products)
+        if products is not None and not force_refresh:
+            return products
+        products = get_all_products(_apigee_edge_session, nhsd_apim_config)
+        from_cache = False
+        by_proxy = _index_products_by_proxy(products)
+        _store_cached_products(pytestconfig, nhsd_apim_config, products)
+        return products
+
+    def for_proxy(proxy_name, force_refresh=False):
+        get(force_refresh=force_refresh)
+        return list(by_proxy.get(proxy_name, []))
+
+    get.for_proxy = for_proxy
+    get.from_cache = lambda: from_cache
+    return get
 
 
 @pytest.fixture()
 @log_method
-def _proxy_products(_apigee_edge_session, nhsd_apim_proxy_name, nhsd_apim_config):
+def _proxy_products(_apigee_products, nhsd_apim_proxy_name):
     """
     Find all products that grant access to your proxy (by name).
 
@@ -143,14 +438,12 @@ def _proxy_products(_apigee_edge_session, nhsd_apim_proxy_name, nhsd_apim_config
     This also allows us to skip checking whether the returned list is
     empty in other fixtures.
     """
-    global _APIGEE_PRODUCTS
-    proxy_products = [product for product in _APIGEE_PRODUCTS if nhsd_apim_proxy_name in product["proxies"]]
+    proxy_products = _apigee_products.for_proxy(nhsd_apim_proxy_name)
 
     if len(proxy_products) == 0:
         # Refresh the list and try again...
-        _APIGEE_PRODUCTS = get_all_products(_apigee_edge_session, nhsd_apim_config)
+        proxy_products = _apigee_products.for_proxy(nhsd_apim_proxy_name, force_refresh=True)
 
-    proxy_products = [product for product in _APIGEE_PRODUCTS if nhsd_apim_proxy_name in product["proxies"]]
     if len(proxy_products) == 0:
         raise ValueError(f"No products grant access to proxy {nhsd_apim_proxy_name}")
 
@@ -237,16 +530,34 @@ def _identity_service_proxy_name(_identity_service_proxy_names, nhsd_apim_author
     if not nhsd_apim_authorization:
         return None
 
-    keycloak = next(filter(lambda name: "-mock" in name, _identity_service_proxy_names), None)
+    keycloak = next((name for name in _identity_service_proxy_names if "-mock" in name), None)
     if keycloak:
         return keycloak
     warnings.warn(f"Unable to find mock auth generation 2 in {_identity_service_proxy_names}.")
     return _identity_service_proxy_names[0]
 
 
+@pytest.fixture(scope="session")
+def _product_scope_index():
+    """
+    Per-session memo of {proxy name: {scope: first product with scope}}.
+    """
+    return {}
+
+
+def _index_products_by_scope(products):
+    index = {}
+    for product in products:
+        for scope in product["scopes"]:
+            index.setdefault(scope, product)
+    return index
+
+
 @pytest.fixture()
 @log_method
-def _proxy_product_with_scope(_scope, _proxy_products, nhsd_apim_proxy_name):
+def _proxy_product_with_scope(
+    _scope, _proxy_products, nhsd_apim_proxy_name, _product_scope_index, _apigee_products
+):
     """
     The first product with a scope matching the one specified by the
     pytest.marker.product_scope fixture.
@@ -263,9 +574,18 @@ def _proxy_product_with_scope(_scope, _proxy_products, nhsd_apim_proxy_name):
         # Any product referencing the proxy under test is fine, so
         # return the first one.
         return _proxy_products[0]
-    for product in _proxy_products:
-        if _scope in product["scopes"]:
-            return product
+    index = _product_scope_index.get(nhsd_apim_proxy_name)
+    if index is None or _scope not in index:
+        # First lookup for this proxy, or an earlier test refreshed the
+        # product list after we indexed it.
+        index = _product_scope_index[nhsd_apim_proxy_name] = _index_products_by_scope(_proxy_products)
+    if _scope not in index and _apigee_products.from_cache():
+        # The list was saved by an earlier run, and the product may have
+        # been added since. A list fetched this session is up to date.
+        proxy_products = _apigee_products.for_proxy(nhsd_apim_proxy_name, force_refresh=True)
+        index = _product_scope_index[nhsd_apim_proxy_name] = _index_products_by_scope(proxy_products)
+    if _scope in index:
+        return index[_scope]
     error_msg = f"No product granting access to proxy under test has scope `{_scope}`"
     log.error(error_msg)
     raise ValueError(error_msg)
@@ -278,14 +598,52 @@ def test_app(nhsd_apim_test_app) -> Callable:
     return nhsd_apim_test_app
 
 
-_TEST_APP = None
+_PUT_ATTEMPTS = 3
+
+
+class _AppStateCache:
+    """
+    Our last known copy of the test app, and its ETag if Apigee sent
+    one.
+    """
+
+    def __init__(self):
+        self.app: Optional[Dict[str, Any]] = None
+        self.etag: Optional[str] = None
+
+    def update(self, resp: requests.Response) -> Dict[str, Any]:
+        self.app = response_json(resp)
+        self.etag = resp.headers.get("ETag")
+        return self.app
+
+    def invalidate(self):
+        """
+        Forget our copy of the test app so the next read goes to Apigee.
+        """
+        self.app = None
+        self.etag = None
+
+
+@pytest.fixture(scope="session")
+def _test_app_cache() -> _AppStateCache:
+    return _AppStateCache()
 
 
 @pytest.fixture(scope="session")
 @log_method
-def nhsd_apim_test_app(_create_test_app, _apigee_edge_session, _apigee_app_base_url, _apigee_app_base_url_no_dev, _test_app_id) -> Callable:
+def nhsd_apim_test_app(
+    _create_test_app,
+    _apigee_edge_session,
+    _apigee_app_base_url,
+    _apigee_app_base_url_no_dev,
+    _test_app_id,
+    _test_app_cache,
+) -> Callable:
     """
     A Callable that gets you the current state of the test app.
+
+    Call `nhsd_apim_test_app.invalidate()` after changing the app
+    behind its back so the next call fetches it again.
     """
 
     # pytest fixtures are wonderful, and do lots of magical things.
@@ -309,19 +667,28 @@ def nhsd_apim_test_app(_create_test_app, _apigee_edge_session, _apigee_app_base_
     # about the app at all, they will just have credentials to call
     # their api.
     def app(force_refresh=False):
-        global _TEST_APP
-        if _TEST_APP and not force_refresh:
-            return _TEST_APP
+        cache = _test_app_cache
+        if cache.app and not force_refresh:
+            return cache.app
         if _test_app_id:
-            resp = _apigee_edge_session.get(_apigee_app_base_url_no_dev + "/" + _test_app_id)
-        else: 
-            resp = _apigee_edge_session.get(_apigee_app_base_url + "/" + _create_test_app["name"])
-        _TEST_APP = resp.json()
-        return _TEST_APP
-
+            url = _apigee_app_base_url_no_dev + "/" + _test_app_id
+        else:
+            url = _apigee_app_base_url + "/" + _create_test_app["name"]
+        # Conditional GET: if Apigee hands us an ETag we can skip the
+        # body when nothing has changed. Without one this is a plain GET.
+        headers = {"If-None-Match": cache.etag} if cache.app and cache.etag else {}
+        resp = _apigee_edge_session.get(url, headers=headers)
+        if resp.status_code == 304:
+            return cache.app
+        return cache.update(resp)
+
+    app.invalidate = _test_app_cache.invalidate
     return app
 
 
+_UNSUBSCRIBE_WORKERS = 8
+
+
 @log_method
 @pytest.fixture(scope="session")
 def nhsd_apim_unsubscribe_test_app_from_all_products(
@@ -343,33 +710,49 @@ def nhsd_apim_unsubscribe_test_app_from_all_products(
 
         app = nhsd_apim_test_app(force_refresh=True)
         app_name = app["name"]
-        for cred in app["credentials"]:
-            key = cred["consumerKey"]
-            resp = _apigee_edge_session.delete(_apigee_app_base_url + f"/{app_name}/keys/{key}")
-        app = nhsd_apim_test_app(force_refresh=True)
+        key_urls = [_apigee_app_base_url + f"/{app_name}/keys/{cred['consumerKey']}" for cred in app["credentials"]]
+        with ThreadPoolExecutor(max_workers=_UNSUBSCRIBE_WORKERS) as executor:
+            responses = list(executor.map(_apigee_edge_session.delete, key_urls))
+        # Whoever next asks for the app will fetch its new state.
+        nhsd_apim_test_app.invalidate()
+        for key_url, resp in zip(key_urls, responses):
+            _check_status(resp, 200, f"Could not DELETE credentials {key_url}.")
 
     return unsubscribe
 
 
+def _is_approved(x):
+    return x["status"] == "approved"
+
+
 @log_method
 def get_matching_creds(app, product_name):
     """
     Takes some app JSON and gets credentials
     """
-
-    def approved(x):
-        return x["status"] == "approved"
-
-    now = int(1000 * datetime.utcnow().timestamp())
-    for creds in filter(approved, app["credentials"]):
+    now = time.time_ns() // 1_000_000
+    for creds in app["credentials"]:
+        if not _is_approved(creds):
+            continue
         if creds["expiresAt"] == -1 or now < creds["expiresAt"]:
-            approved_product_names = [p["apiproduct"] for p in filter(approved, creds["apiProducts"])]
+            approved_product_names = {p["apiproduct"] for p in creds["apiProducts"] if _is_approved(p)}
             if product_name in approved_product_names:
                 return creds
 
 
 @log_method
-def get_app_credentials_for_product(apigee_app_base_url, apigee_edge_session, app, product_name, _test_app_id):
+def get_app_credentials_for_product(
+    apigee_app_base_url, apigee_edge_session, app, product_name, _test_app_id, app_cache=None
+):
+    """
+    Get credentials on `app` for `product_name`, adding a new set of
+    credentials if there aren't any yet.
+
+    Pass the session's `_test_app_cache` as `app_cache` to keep it up
+    to date and to guard the update with the app's ETag.
+    """
+    if app_cache is None:
+        app_cache = _AppStateCache()
     matching_creds = get_matching_creds(app, product_name)
     if matching_creds is not None:
         return matching_creds
@@ -381,15 +764,28 @@ def get_app_credentials_for_product(apigee_app_base_url, apigee_edge_session, ap
 
     # Use the apigee edge api to add another set of credentials
     # https://apidocs.apigee.com/docs/developer-apps/1/routes/organizations/%7Borg_name%7D/developers/%7Bdeveloper_email%7D/apps/%7Bapp_name%7D/put
-    app["apiProducts"] = [product_name]
     app_url = apigee_app_base_url + "/" + app["name"]
-    resp = apigee_edge_session.put(app_url, json=app)
+    for attempt in range(1, _PUT_ATTEMPTS + 1):
+        app["apiProducts"] = [product_name]
+        # Guard the PUT with the ETag from our last read (if Apigee gave
+        # us one) so concurrent workers don't clobber each other.
+        headers = {"If-Match": app_cache.etag} if app_cache.etag else {}
+        resp = apigee_edge_session.put(app_url, json=app, headers=headers)
+        if resp.status_code != 412:
+            break
+        if attempt == _PUT_ATTEMPTS:
+            raise ValueError(f"Gave up updating {app_url} after {_PUT_ATTEMPTS} conflicting writes")
+        # Somebody else updated the app first. Their update might be
+        # exactly the one we wanted.
+        get_resp = apigee_edge_session.get(app_url)
+        _check_status(get_resp, 200, f"Failed to refetch {app_url} after a conflicting write")
+        app = app_cache.update(get_resp)
+        matching_creds = get_matching_creds(app, product_name)
+        if matching_creds is not None:
+            return matching_creds
     if resp.status_code != 200:
-        raise ValueError(f"Unexpected response from {app_url}: {resp.status_code}, {resp.text}")
-    global _TEST_APP
-    _TEST_APP = resp.json()
-
-    matching_creds = get_matching_creds(_TEST_APP, product_name)
+        raise ValueError(f"Unexpected response from {app_url}: {resp.status_code}, {_error_content(resp)}")
+    matching_creds = get_matching_creds(app_cache.update(resp), product_name)
     return matching_creds
 
 
@@ -402,6 +798,7 @@ def _test_app_credentials(
     _scope,
     _proxy_product_with_scope,
     _test_app_id,
+    _test_app_cache,
 ):
     """
     Get matching credentials for `test_app`, which have access
@@ -414,21 +811,10 @@ def _test_app_credentials(
         app,
         _proxy_product_with_scope["name"],
         _test_app_id,
+        app_cache=_test_app_cache,
     )
 
 
-@pytest.fixture(scope="session")
-@log_method
-def _apigee_edge_session(nhsd_apim_config):
-    """
-    Create an APIGEE `requests` session.
-    """
-    token = nhsd_apim_config["APIGEE_ACCESS_TOKEN"]
-    session = requests.session()
-    session.headers = {"Authorization": f"Bearer {token}"}
-    return session
-
-
 @pytest.fixture(scope="session")
 def nhsd_apim_pre_create_app():
     """
@@ -438,6 +824,44 @@ def nhsd_apim_pre_create_app():
     yield
 
 
+def _create_app(session, apigee_app_base_url, jwt_public_key_url):
+    app = {
+        "name": f"apim-auto-{uuid4()}",
+        "callbackUrl": "https://example.org/callback",
+        "attributes": [{"name": "jwks-resource-url", "value": jwt_public_key_url}],
+    }
+    create_resp = session.post(apigee_app_base_url, json=app)
+    _check_status(create_resp, 201, f"Could not CREATE TestApp: `{app['name']}`.")
+    return response_json(create_resp)
+
+
+def _delete_app(session, apigee_app_base_url, app):
+    delete_resp = session.delete(apigee_app_base_url + "/" + app["name"])
+    _check_status(delete_resp, 200, f"Could not DELETE TestApp: `{app['name']}`.")
+
+
+def _delete_app_in_background(session, apigee_app_base_url, app):
+    """
+    Delete the app without holding up the rest of pytest's teardown.
+
+    The thread isn't a daemon, so the interpreter still waits for the
+    DELETE before exiting. The tests have finished by now, so a failure
+    is logged rather than raised.
+    """
+
+    def delete():
+        try:
+            _delete_app(session, apigee_app_base_url, app)
+        except Exception as e:
+            log.error(str(e))
+
+    threading.Thread(target=delete, name=f"delete-{app['name']}", daemon=False).start()
+
+
+def _keep_app(app):
+    log.warning(f"Keeping TestApp `{app['name']}`, remember to delete it.")
+
+
 @pytest.fixture(scope="session")
 @log_method
 def _create_test_app(
@@ -447,6 +871,10 @@ def _create_test_app(
     jwt_public_key_url,
     nhsd_apim_pre_create_app,
     _test_app_id,
+    nhsd_apim_config,
+    tmp_path_factory,
+    _test_app_cache,
+    pytestconfig,
 ):
     """
     Create an ephemeral app that lasts the duration of the pytest
@@ -457,40 +885,44 @@ def _create_test_app(
     so one app can test your API against multiple product
     configurations should you need to do so.  See `app_credentials`
     for details.
+
+    Under pytest-xdist (with `filelock` installed) all workers share
+    a single app, created by the first worker and deleted by the last.
+
+    Pass `--nhsd-apim-keep-app` to leave the app on Apigee afterwards.
     """
 
     # Retrieving pre-existing app
     if not _test_app_id == "":
         get_resp = _apigee_edge_session.get(_apigee_app_base_url_no_dev + "/" + _test_app_id)
-        err_msg = f"Could not GET TestApp: {_test_app_id}.\tReason: {get_resp.text}"
-        assert get_resp.status_code == 200, err_msg
-        yield get_resp.json()
+        _check_status(get_resp, 200, f"Could not GET TestApp: {_test_app_id}.")
+        yield response_json(get_resp)
     else:
-        app = {
-            "name": f"apim-auto-{uuid4()}",
-            "callbackUrl": "https://example.org/callback",
-            "attributes": [{"name": "jwks-resource-url", "value": jwt_public_key_url}],
-        }
-        create_resp = _apigee_edge_session.post(_apigee_app_base_url, json=app)
-        err_msg = f"Could not CREATE TestApp: `{app['name']}`.\tReason: {create_resp.text}"
-        assert create_resp.status_code == 201, err_msg
-
-        yield create_resp.json()
-        delete_resp = _apigee_edge_session.delete(_apigee_app_base_url + "/" + app["name"])
-        err_msg = f"Could not DELETE TestApp: `{app['name']}`.\tReason: {delete_resp.text}"
-        assert delete_resp.status_code == 200, err_msg
-    global _TEST_APP
-    _TEST_APP = None
+        create = functools.partial(_create_app, _apigee_edge_session, _apigee_app_base_url, jwt_public_key_url)
+        if pytestconfig.getoption("NHSD_APIM_KEEP_APP"):
+            delete = _keep_app
+        else:
+            delete = functools.partial(_delete_app_in_background, _apigee_edge_session, _apigee_app_base_url)
+        if xdist_share.sharing_enabled():
+            org = nhsd_apim_config["APIGEE_ORGANIZATION"]
+            yield from xdist_share.shared_resource(tmp_path_factory, f"apim-auto-{org}", create, delete)
+        else:
+            app = create()
+            yield app
+            delete(app)
+    _test_app_cache.invalidate()
 
 
 @pytest.fixture(scope="function")
 @log_method
 def _create_function_scoped_test_app(
     _apigee_app_base_url,
+    _apigee_app_base_url_no_dev,
     _apigee_edge_session,
     jwt_public_key_url,
     nhsd_apim_pre_create_app,
     _test_app_id,
+    _test_app_cache,
 ):
     """
     Create an ephemeral app that lasts the duration of the pytest
@@ -506,25 +938,13 @@ def _create_function_scoped_test_app(
     # Retrieving pre-existing app
     if not _test_app_id == "":
         get_resp = _apigee_edge_session.get(_apigee_app_base_url_no_dev + "/" + _test_app_id)
-        err_msg = f"Could not GET TestApp: {_test_app_id}.\tReason: {get_resp.text}"
-        assert get_resp.status_code == 200, err_msg
-        yield get_resp.json()
+        _check_status(get_resp, 200, f"Could not GET TestApp: {_test_app_id}.")
+        yield response_json(get_resp)
     else:
-        app = {
-            "name": f"apim-auto-{uuid4()}",
-            "callbackUrl": "https://example.org/callback",
-            "attributes": [{"name": "jwks-resource-url", "value": jwt_public_key_url}],
-        }
-        create_resp = _apigee_edge_session.post(_apigee_app_base_url, json=app)
-        err_msg = f"Could not CREATE TestApp: `{app['name']}`.\tReason: {create_resp.text}"
-        assert create_resp.status_code == 201, err_msg
-
-        yield create_resp.json()
-        delete_resp = _apigee_edge_session.delete(_apigee_app_base_url + "/" + app["name"])
-        err_msg = f"Could not DELETE TestApp: `{app['name']}`.\tReason: {delete_resp.text}"
-        assert delete_resp.status_code == 200, err_msg
-    global _TEST_APP
-    _TEST_APP = None
+        app = _create_app(_apigee_edge_session, _apigee_app_base_url, jwt_public_key_url)
+        yield app
+        _delete_app(_apigee_edge_session, _apigee_app_base_url, app)
+    _test_app_cache.invalidate()
 
 
 @pytest.fixture(scope="session")
@@ -538,16 +958,34 @@ def _test_app_callback_url(_create_test_app):
 def _test_app_id(nhsd_apim_config):
     return nhsd_apim_config["APIGEE_APP_ID"]
 
+@pytest.fixture(scope="session")
+def _apigee_nonprod_credentials():
+    """
+    Credentials for the Apigee management API, read once per session.
+    """
+    return ApigeeNonProdCredentials()
+
+
+@pytest.fixture(scope="session")
+@log_method
+def _apigee_client(_apigee_nonprod_credentials):
+    """
+    One authenticated Apigee client shared by all the API wrapper
+    fixtures, so they share its token and connection pool.
+    """
+    client = ApigeeClient(config=_apigee_nonprod_credentials)
+    _mount_retrying_adapter(client)
+    return client
+
+
 @pytest.fixture()
 @log_method
-def trace(_apigee_proxy):
+def trace(_apigee_proxy, _apigee_client):
     """
     Authenticated wrapper around the DebugSessionsAPI class
     """
-    config = ApigeeNonProdCredentials()
-    client =  ApigeeClient(config=config)
     debug = DebugSessionsAPI(
-        client=client,
+        client=_apigee_client,
         env_name=_apigee_proxy["environment"],
         api_name=_apigee_proxy["name"],
         revision_number=_apigee_proxy["revision"]
@@ -556,41 +994,33 @@ def trace(_apigee_proxy):
 
 @pytest.fixture(scope="session")
 @log_method
-def access_token_api():
+def access_token_api(_apigee_client):
     """
     Authenitcated wrapper for Apigee's access token API
     """
-    config = ApigeeNonProdCredentials()
-    client = ApigeeClient(config=config)
-    return AccessTokensAPI(client=client)
+    return AccessTokensAPI(client=_apigee_client)
 
 
 @pytest.fixture(scope="session")
 @log_method
-def products_api():
+def products_api(_apigee_client):
     """
     Authenitcated wrapper for Apigee's products API
     """
-    config = ApigeeNonProdCredentials()
-    client = ApigeeClient(config=config)
-    return ApiProductsAPI(client=client)
+    return ApiProductsAPI(client=_apigee_client)
 
 @pytest.fixture(scope="session")
 @log_method
-def developer_apps_api():
+def developer_apps_api(_apigee_client):
     """
     Authenitcated wrapper for Apigee's developer apps API
     """
-    config = ApigeeNonProdCredentials()
-    client = ApigeeClient(config=config)
-    return DeveloperAppsAPI(client=client)
+    return DeveloperAppsAPI(client=_apigee_client)
 
 @pytest.fixture(scope="session")
 @log_method
-def developer_app_keys_api():
+def developer_app_keys_api(_apigee_client):
     """
     Authenitcated wrapper for Apigee's developer app keys API
     """
-    config = ApigeeNonProdCredentials()
-    client = ApigeeClient(config=config)
-    return AppKeysAPI(client=client)
+    return AppKeysAPI(client=_apigee_client)
@@ -1,13 +1,16 @@
-from typing import Literal, Dict, Optional
+from typing import Literal, Dict
 import json
 import base64
+import hashlib
 from functools import lru_cache
 
 import pytest
 
 from authlib.jose import jwk
-from Crypto.PublicKey import RSA
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
 
+from . import disk_cache, xdist_share
 from .log import log_method
 from .token_cache import cache_tokens
 
@@ -23,6 +26,31 @@ from .identity_service import (
 )
 
 
+# auth_scope -> (keycloak realm prefix, key in keycloak_client_credentials)
+_KEYCLOAK_REALMS = {
+    "nhs-cis2": ("Cis2-mock", "cis2"),
+    "nhs-login": ("NHS-Login-mock", "nhs-login"),
+}
+
+
+@log_method
+@cache_tokens
+def _get_keycloak_user_tokens(realm, client_id, client_secret, login_form):
+    """
+    Log in to keycloak. Cached separately from the token exchange, so
+    exchanging for another app's access token reuses a still-valid
+    id_token instead of logging in again.
+    """
+    config = KeycloakUserConfig(
+        realm=realm,
+        client_id=client_id,
+        client_secret=client_secret,
+        login_form=login_form,
+    )
+    authenticator = KeycloakUserAuthenticator(config=config)
+    return authenticator.get_token()
+
+
 @log_method
 @cache_tokens
 def get_access_token_via_user_restricted_flow_separate_auth(
@@ -34,28 +62,18 @@ def get_access_token_via_user_restricted_flow_separate_auth(
     jwt_kid,
     auth_scope: Literal["nhs-login", "nhs-cis2"],
     apigee_environment,
+    force_new_token=False,
 ):
-    if auth_scope == "nhs-cis2":
-        # Get token from keycloak
-        config = KeycloakUserConfig(
-            realm=f"Cis2-mock-{apigee_environment}",
-            client_id=keycloak_client_credentials["cis2"]["client_id"],
-            client_secret=keycloak_client_credentials["cis2"]["client_secret"],
-            login_form=login_form,
-        )
-        authenticator = KeycloakUserAuthenticator(config=config)
-        id_token = authenticator.get_token()["id_token"]
-
-    else:
-        # Get token from keycloak
-        config = KeycloakUserConfig(
-            realm=f"NHS-Login-mock-{apigee_environment}",
-            client_id=keycloak_client_credentials["nhs-login"]["client_id"],
-            client_secret=keycloak_client_credentials["nhs-login"]["client_secret"],
-            login_form=login_form,
-        )
-        authenticator = KeycloakUserAuthenticator(config=config)
-        id_token = authenticator.get_token()["id_token"]
+    # Get token from keycloak
+    realm_prefix, credentials_key = _KEYCLOAK_REALMS.get(auth_scope, _KEYCLOAK_REALMS["nhs-login"])
+    credentials = keycloak_client_credentials[credentials_key]
+    id_token = _get_keycloak_user_tokens(
+        f"{realm_prefix}-{apigee_environment}",
+        credentials["client_id"],
+        credentials["client_secret"],
+        login_form,
+        force_new_token=force_new_token,
+    )["id_token"]
 
     # Exchange token
     config = TokenExchangeConfig(
@@ -118,13 +136,20 @@ def get_access_token_via_signed_jwt_flow(
 @log_method
 def create_jwt_key_pair(key_id):
     """
-    Pure python instructions to generate a public-key/ private-key
+    Generate a public-key/ private-key
     pair in the correct format.
     """
     key_size = 4096
-    key = RSA.generate(key_size)
-    private_key_pem = key.exportKey("PEM").decode()
-    public_key_pem = key.publickey().exportKey("PEM").decode()
+    key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+    private_key_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.TraditionalOpenSSL,
+        serialization.NoEncryption(),
+    ).decode()
+    public_key_pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
 
     # This is the JSON formatted public key
     json_web_key = jwk.dumps(
@@ -140,6 +165,27 @@ def create_jwt_key_pair(key_id):
     }
 
 
+def _load_or_create_jwt_key_pair(key_id):
+    """
+    `create_jwt_key_pair`, but reusing the key pair from an earlier run
+    when NHSD_APIM_CACHE_MODE isn't `disabled`.
+
+    Generating a 4096 bit key takes a few seconds. The test app that
+    trusts the public key is deleted at the end of each session, so
+    reusing the key pair across sessions is harmless.
+    """
+    if disk_cache.cache_mode() == "disabled":
+        return create_jwt_key_pair(key_id)
+
+    path = disk_cache.CACHE_DIR / "jwt-keys" / f"{hashlib.sha256(key_id.encode()).hexdigest()}.json"
+    # Ignore a key file others can read, and replace it with a private one.
+    key_pair = disk_cache.read_json(path, private=True)
+    if key_pair is None:
+        key_pair = create_jwt_key_pair(key_id)
+        disk_cache.write_json(path, key_pair)
+    return key_pair
+
+
 @pytest.fixture(scope="session")
 @log_method
 def jwt_public_key_id(nhsd_apim_config):
@@ -148,8 +194,15 @@ def jwt_public_key_id(nhsd_apim_config):
 
 @pytest.fixture(scope="session")
 @log_method
-def _jwt_keys(jwt_public_key_id):
-    return create_jwt_key_pair(jwt_public_key_id)
+def _jwt_keys(jwt_public_key_id, tmp_path_factory):
+    # xdist workers share one test app, so they must share its keys too.
+    if xdist_share.sharing_enabled():
+        return xdist_share.get_or_create(
+            tmp_path_factory,
+            f"jwt-keys-{jwt_public_key_id}",
+            lambda: _load_or_create_jwt_key_pair(jwt_public_key_id),
+        )
+    return _load_or_create_jwt_key_pair(jwt_public_key_id)
 
 
 @pytest.fixture(scope="session")
@@ -8,7 +8,6 @@ This module defines all the pytest config.
 And a few fixtures to pull that config in.
 """
 import os
-from datetime import datetime
 
 import pytest
 
@@ -81,6 +80,18 @@ def pytest_addoption(parser):
             help=attrs.get("help"),
             default=attrs.get("default"),
         )
+    group.addoption(
+        "--no-apigee-cache",
+        action="store_true",
+        dest="NO_APIGEE_CACHE",
+        help="Don't reuse the Apigee product list cached by an earlier run today, even if NHSD_APIM_CACHE_MODE is set.",
+    )
+    group.addoption(
+        "--nhsd-apim-keep-app",
+        action="store_true",
+        dest="NHSD_APIM_KEEP_APP",
+        help="Don't delete the test app at the end of the session.",
+    )
 
 
 def pytest_configure(config):
@@ -0,0 +1,59 @@
+"""
+Opt-in on-disk cache shared by the fixtures, for quick iterative local
+runs.
+
+NHSD_APIM_CACHE_MODE controls it:
+ - enabled: reuse cached entries while they're still valid.
+ - replay: always reuse cached entries.
+ - disabled (the default): never read or write the cache.
+
+Entries live under ~/.cache/pytest-nhsd-apim and are written atomically,
+so concurrent runs (or xdist workers) see either the old file or the
+complete new one.
+"""
+import json
+import os
+import tempfile
+from pathlib import Path
+
+CACHE_MODES = ("enabled", "replay", "disabled")
+CACHE_DIR = Path.home() / ".cache" / "pytest-nhsd-apim"
+
+
+def cache_mode():
+    mode = os.environ.get("NHSD_APIM_CACHE_MODE", "disabled")
+    if mode not in CACHE_MODES:
+        raise ValueError(f"NHSD_APIM_CACHE_MODE must be one of {CACHE_MODES}, not `{mode}`")
+    return mode
+
+
+def read_json(path, private=False):
+    """
+    The JSON stored in `path`, or None if it's missing or unreadable.
+
+    With `private`, a file that's readable by group or others is
+    treated as missing too, so that it gets rewritten with 0600.
+    """
+    try:
+        if private and path.stat().st_mode & 0o077:
+            return None
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def write_json(path, value):
+    """
+    Write `value` to `path` via a temporary file in the same directory.
+    The file is only readable by its owner.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # mkstemp creates the file with mode 0600.
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with open(fd, "w") as f:
+            json.dump(value, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,19 @@
+"""
+Apigee can send back multi-megabyte JSON, e.g. a page of 1000 expanded
+products. orjson parses that several times faster than the standard
+library, so we use it when it's installed and fall back to `requests`'
+own decoding when it isn't.
+"""
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def response_json(resp):
+    """
+    Drop-in replacement for `resp.json()`.
+    """
+    if orjson is None:
+        return resp.json()
+    return orjson.loads(resp.content)
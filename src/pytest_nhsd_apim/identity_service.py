@@ -6,14 +6,16 @@ and more... Feel free to keep adding authenticators here and
 maybe move this file to its own library.
 """
 
-import uuid
+import secrets
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
 from time import time
 from typing import Literal
 
 import jwt
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 from pydantic import BaseModel, HttpUrl, validator
 from abc import ABC, abstractmethod
-from typing import Literal
 from urllib.parse import parse_qs, urlparse
 
 import requests
@@ -98,6 +100,15 @@ class AuthorizationCodeConfig(BaseModel):
         return environment
 
 
+@lru_cache(maxsize=None)
+def _load_private_key(private_key_pem: str):
+    """
+    Parse a PEM private key once, rather than letting `jwt.encode` parse
+    it again for every client assertion.
+    """
+    return load_pem_private_key(private_key_pem.encode(), password=None)
+
+
 class ClientCredentialsConfig(BaseModel):
     """Config needed to authenticate using client_credentials flow in the identity service"""
 
@@ -131,13 +142,13 @@ class ClientCredentialsConfig(BaseModel):
         claims = {
             "sub": self.client_id,
             "iss": self.client_id,
-            "jti": str(uuid.uuid4()),
+            "jti": secrets.token_hex(16),
             "aud": url,
             "exp": int(time()) + 300,  # 5 minutes in the future
         }
         additional_headers = {"kid": self.jwt_kid}
         client_assertion = jwt.encode(
-            claims, self.jwt_private_key, algorithm="RS512", headers=additional_headers
+            claims, _load_private_key(self.jwt_private_key), algorithm="RS512", headers=additional_headers
         )
         return client_assertion
 
@@ -179,13 +190,13 @@ class NHSLoginConfig(BaseModel):
         claims = {
             "sub": self.client_id,
             "iss": self.client_id,
-            "jti": str(uuid.uuid4()),
+            "jti": secrets.token_hex(16),
             "aud": url,
             "exp": int(time()) + 300,  # 5 minutes in the future
         }
         additional_headers = {"kid": self.jwt_kid}
         client_assertion = jwt.encode(
-            claims, self.jwt_private_key, algorithm=self.alg, headers=additional_headers
+            claims, _load_private_key(self.jwt_private_key), algorithm=self.alg, headers=additional_headers
         )
         return client_assertion
     
@@ -194,6 +205,13 @@ class NHSLoginConfig(BaseModel):
 class BananaAuthenticatorConfig:  # Placeholder
     pass
 
+# Shared by the token endpoint calls that don't need a login session,
+# so consecutive tokens reuse its pooled connections. It never stores
+# cookies, so nothing carries over from one call to the next.
+_TOKEN_SESSION = requests.session()
+_TOKEN_SESSION.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+
 ### Authenticators
 class Authenticator(ABC):
     """Defines the interface"""
@@ -216,7 +234,6 @@ class ClientCredentialsAuthenticator(Authenticator):
         self.config = config
 
     def get_token(self):
-        login_session = requests.session()
         data = {
             "grant_type": "client_credentials",
             "client_assertion_type": "urn:ietf:params:oauth:client-assertion-type:jwt-bearer",
@@ -224,7 +241,7 @@ class ClientCredentialsAuthenticator(Authenticator):
         }
         # 1. Do the post call to the identity service
         url = f"{self.config.identity_service_base_url}/token"
-        resp = login_session.post(url, data=data)
+        resp = _TOKEN_SESSION.post(url, data=data)
         # 2. Catch any unexpected error
         if resp.status_code != 200:
             raise RuntimeError(f"{resp.status_code}: {resp.text}")
@@ -270,24 +287,20 @@ class AuthorizationCodeAuthenticator(Authenticator):
 
     @staticmethod
     def _get_authorize_form_submission_data(authorize_form, login_options):
-        inputs = list(authorize_form.inputs)
-
-        form_submission_data = {}
-        # This loop picks up the pre-populated defaults, which is
+        # This picks up the pre-populated defaults, which is
         # sufficient for simulated auth. Defaults can be appended to with
         # the "login_options".
-        for _input in inputs:
-            input_data = dict(_input.items())
-            name = input_data["name"]
-            value = input_data["value"]
-            form_submission_data[name] = value
+        form_submission_data = {
+            _input.get("name"): _input.get("value")
+            for _input in authorize_form.xpath(".//input[@name]")
+        }
 
         form_submission_data.update(login_options)
         return form_submission_data
 
     @staticmethod
-    def _get_authorization_form(html_str):
-        tree = html.fromstring(html_str)
+    def _get_authorization_form(html_bytes):
+        tree = html.fromstring(html_bytes)
         form = tree.forms[0]
         return form
 
@@ -336,9 +349,7 @@ class AuthorizationCodeAuthenticator(Authenticator):
             self.config.scope,
         )
 
-        authorize_form = self._get_authorization_form(
-            authorize_response.content.decode()
-        )
+        authorize_form = self._get_authorization_form(authorize_response.content)
         # 2. Parse the login page.  For keycloak this presents an
         # HTML form, which must be filled in with valid data.  The tester
         # can submits their login data with the `login_form` field.
@@ -427,8 +438,7 @@ class KeycloakUserAuthenticator(Authenticator):
             },
         )
         # 2. Parse it!
-        tree = html.fromstring(resp.text)
-        form = tree.get_element_by_id("kc-form-login")
+        form = html.fromstring(resp.content).xpath('//form[@id="kc-form-login"]')[0]
         # 3. Complete the login form with the credentials in login_form.
         resp2 = login_session.post(form.action, data=self.config.login_form)
         location = urlparse(resp2.history[-1].headers["location"])
@@ -475,7 +485,7 @@ class TokenExchangeAuthenticator(Authenticator):
         }
         # 1. Make the post request to the identity service
         url = f"{self.config.identity_service_base_url}/token"
-        resp = requests.post(url, data=data)
+        resp = _TOKEN_SESSION.post(url, data=data)
         # 2. Catch any error
         if resp.status_code != 200:
             raise RuntimeError(f"{resp.status_code}: {resp.text}")
@@ -521,7 +531,6 @@ class NHSLoginAosAuthenticator(Authenticator):
 
     def get_token(self):
         code = self.config.authorize_code or self._get_authorize_code()
-        login_session = requests.session()
         data = {
             "grant_type": "authorization_code",
             "code": code,
@@ -531,7 +540,7 @@ class NHSLoginAosAuthenticator(Authenticator):
         }
         # 1. Do the post call to the identity service
         url = f"{self.config.nhs_login_base_url}/token"
-        resp = login_session.post(url, data=data)
+        resp = _TOKEN_SESSION.post(url, data=data)
         # 2. Catch any unexpected error
         if resp.status_code != 200:
             raise RuntimeError(f"{resp.status_code}: {resp.text}")
@@ -6,13 +6,11 @@ need to re-invent the wheel.
 
 https://docs.pytest.org/en/7.1.x/how-to/logging.html
 """
-import typing
 import logging
 import inspect
 import functools
 import uuid
 import json
-import os
 from datetime import datetime
 
 logging.METHOD = 5
@@ -37,15 +35,17 @@ def log_method(f):
     Includes args, kwargs, return values, and exceptions.
     Tags each entry/exit pair with a uuid4 for correlation.
 
-    It puts it at a SUPER-LOW logging level (5).
+    It puts it at a SUPER-LOW logging level (5). When that level is
+    disabled, which is the usual case, the wrapper just calls `f`.
     """
+    is_generator = inspect.isgeneratorfunction(f)
 
     def pre_log(f, *args, **kwargs):
         log_line = {
             "timestamp": datetime.utcnow().isoformat(),
             "function_name": f.__name__,
             "id": str(uuid.uuid4()),  # use this to match function entry/exit
-            "type": "generator" if inspect.isgeneratorfunction(f) else "function",
+            "type": "generator" if is_generator else "function",
             "location": "entry",
             "args": list(args),
             "kwargs": dict(**kwargs),
@@ -66,6 +66,9 @@ def log_method(f):
 
     @functools.wraps(f)
     def log_generator(*args, **kwargs):
+        if not log.isEnabledFor(logging.METHOD):
+            yield from f(*args, **kwargs)
+            return
         log_line = pre_log(f, *args, **kwargs)
         try:
             yield from f(*args, **kwargs)
@@ -75,6 +78,8 @@ def log_method(f):
 
     @functools.wraps(f)
     def log_function(*args, **kwargs):
+        if not log.isEnabledFor(logging.METHOD):
+            return f(*args, **kwargs)
         log_line = pre_log(f, *args, **kwargs)
         try:
             output = f(*args, **kwargs)
@@ -83,7 +88,7 @@ def log_method(f):
         post_log(log_line, output=output)
         return output
 
-    return log_generator if inspect.isgeneratorfunction(f) else log_function
+    return log_generator if is_generator else log_function
 
 
 def _jsonify(line):
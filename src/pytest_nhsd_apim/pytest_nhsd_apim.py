@@ -25,16 +25,21 @@ import pytest
 from .apigee_edge import (
     _apigee_app_base_url,
     _apigee_app_base_url_no_dev,
+    _apigee_client,
     _apigee_edge_session,
+    _apigee_nonprod_credentials,
+    _apigee_products,
     _apigee_proxy,
     _create_function_scoped_test_app,
     _create_test_app,
     _identity_service_proxy,
     _identity_service_proxy_name,
     _identity_service_proxy_names,
+    _product_scope_index,
     _proxy_product_with_scope,
     _proxy_products,
     _scope,
+    _test_app_cache,
     _test_app_callback_url,
     _test_app_credentials,
     _test_app_id,
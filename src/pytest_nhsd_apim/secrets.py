@@ -10,12 +10,13 @@ import requests
 from .apigee_edge import (
     _apigee_app_base_url,
     _apigee_edge_session,
+    _test_app_cache,
     _test_app_id,
     apigee_environment,
     get_app_credentials_for_product,
     test_app,
 )
-from .log import log, log_method
+from .log import log_method
 
 _SESSION = requests.session()
 
@@ -28,6 +29,7 @@ def _mock_jwks_api_key(
     test_app,
     apigee_environment,
     _test_app_id,
+    _test_app_cache,
 ):
     # Apps in prod Apigee shouldn't rely on mock-jwks for their api key
     if apigee_environment in ["dev", "sandbox", "int", "prod"]:
@@ -39,6 +41,7 @@ def _mock_jwks_api_key(
         test_app(),
         f"mock-jwks-{apigee_environment}",
         _test_app_id,
+        app_cache=_test_app_cache,
     )
     return creds["consumerKey"]
 
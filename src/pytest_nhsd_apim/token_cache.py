@@ -3,7 +3,8 @@ Making several API calls to get an access token per-test is very expensive.
 
 This module is for caching access tokens.
 """
-from typing import Optional, Dict, Any, Hashable, Tuple
+import inspect
+from typing import Optional, Dict, Any, Hashable
 from time import time
 from functools import wraps
 
@@ -20,7 +21,7 @@ class _TokenCache:
             # only present on app-restricted tokens.  we can inject
             # this ourselves. Assume 5 seconds ago, probably was more
             # recently
-            token_data["issued_at"] = time() - 5000
+            token_data["issued_at"] = int(1000 * time()) - 5000
         self._cache[key] = token_data
 
     @log_method
@@ -33,9 +34,9 @@ class _TokenCache:
 
         old_token_data = self._cache[key]
         grace_period_seconds = 5
-        now_ish = int(time()) + grace_period_seconds
+        now_ish = int(1000 * (time() + grace_period_seconds))
 
-        # issued_at is epoch_time in milliseconds
+        # issued_at (and so now_ish) is epoch_time in milliseconds
         # but expires_in is in seconds
         # => need factor of 1000 in this sum.
         expiry_time = int(old_token_data["issued_at"]) + 1000 * int(
@@ -75,7 +76,14 @@ def cache_tokens(f):
     This means you can just call whatever get_access_token function
     you have decorated and not actually have to run the whole
     authentication journey.
+
+    `force_new_token` is never part of the cache key. If `f` declares a
+    `force_new_token` parameter it is passed through, so `f` can force
+    any cached calls it makes itself.
     """
+    forwards_force_new_token = (
+        "force_new_token" in inspect.signature(f).parameters
+    )
 
     @wraps(f)
     def wrapper(*args, **kwargs):
@@ -99,9 +107,11 @@ def cache_tokens(f):
         )
         token_data = cache.get(cache_key)
         if token_data and not force_new_token:
-            log.debug(f"Cache hit for {func_name} with cache_key {cache_key}")
+            log.debug("Cache hit for %s with cache_key %s", func_name, cache_key)
             return token_data
-        log.debug(f"Cache miss for {func_name} with cache_key {cache_key}")
+        log.debug("Cache miss for %s with cache_key %s", func_name, cache_key)
+        if forwards_force_new_token:
+            kwargs["force_new_token"] = force_new_token
         token_data = f(*args, **kwargs)
         cache.insert(cache_key, token_data)
         return token_data
@@ -0,0 +1,72 @@
+"""
+Share expensive session-wide state between pytest-xdist workers.
+
+Under pytest-xdist every worker runs its own pytest session, so each
+session-scoped fixture runs once *per worker*. For the test app that
+means N workers create (and delete) N apps on Apigee.
+
+This module lets workers share JSON-serialisable state through files
+in the xdist base temp directory, which all workers of a run have in
+common. It needs the optional `filelock` package; without it, or when
+not running under xdist, callers should fall back to doing the work
+themselves.
+"""
+import json
+import os
+
+try:
+    from filelock import FileLock
+except ImportError:
+    FileLock = None
+
+
+def sharing_enabled():
+    return FileLock is not None and "PYTEST_XDIST_WORKER" in os.environ
+
+
+def _shared_path(tmp_path_factory, name):
+    # Each worker's basetemp is a sibling under one per-run directory.
+    return tmp_path_factory.getbasetemp().parent / f"{name}.json"
+
+
+def get_or_create(tmp_path_factory, name, create):
+    """
+    Return the value stored under `name`, calling `create()` to make
+    it if no worker has done so yet.
+    """
+    path = _shared_path(tmp_path_factory, name)
+    with FileLock(f"{path}.lock"):
+        if path.is_file():
+            return json.loads(path.read_text())
+        value = create()
+        path.write_text(json.dumps(value))
+        return value
+
+
+def shared_resource(tmp_path_factory, name, create, destroy):
+    """
+    Generator yielding a resource shared by all workers.
+
+    The first worker in calls `create()`, the last worker out calls
+    `destroy(value)`.
+    """
+    path = _shared_path(tmp_path_factory, name)
+    lock = FileLock(f"{path}.lock")
+    with lock:
+        if path.is_file():
+            state = json.loads(path.read_text())
+        else:
+            state = {"value": create(), "workers": 0}
+        state["workers"] += 1
+        path.write_text(json.dumps(state))
+
+    yield state["value"]
+
+    with lock:
+        state = json.loads(path.read_text())
+        state["workers"] -= 1
+        if state["workers"] == 0:
+            path.unlink()
+            destroy(state["value"])
+        else:
+            path.write_text(json.dumps(state))
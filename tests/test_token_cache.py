@@ -0,0 +1,48 @@
+from pytest_nhsd_apim import token_cache
+from pytest_nhsd_apim.token_cache import _TokenCache, cache_tokens
+
+
+def test_expired_token_is_evicted(monkeypatch):
+    """
+    issued_at is in milliseconds and expires_in in seconds, so a token
+    issued 120s ago with expires_in=60 must be treated as expired.
+    """
+    now = 1_700_000_000.0
+    monkeypatch.setattr(token_cache, "time", lambda: now)
+
+    cache = _TokenCache()
+    cache.insert("key", {"issued_at": int(1000 * (now - 120)), "expires_in": 60})
+
+    assert cache.get("key") is None
+    assert "key" not in cache._cache
+
+
+def test_unexpired_token_is_returned(monkeypatch):
+    now = 1_700_000_000.0
+    monkeypatch.setattr(token_cache, "time", lambda: now)
+
+    cache = _TokenCache()
+    token_data = {"expires_in": 600}
+    cache.insert("key", token_data)
+
+    assert cache.get("key") is token_data
+
+
+def test_force_new_token_is_forwarded_to_nested_cached_calls():
+    calls = []
+
+    @cache_tokens
+    def _inner():
+        calls.append("inner")
+        return {"expires_in": 600, "token": len(calls)}
+
+    @cache_tokens
+    def _outer(force_new_token=False):
+        return _inner(force_new_token=force_new_token)
+
+    first = _outer()
+    assert _outer() == first
+    assert calls == ["inner"]
+
+    assert _outer(force_new_token=True) != first
+    assert calls == ["inner", "inner"]